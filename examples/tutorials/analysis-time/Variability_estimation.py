@@ -81,18 +81,23 @@ plt.show()
 flux = lc_1d.flux.quantity
 flux_err = lc_1d.flux_err.quantity
 
-f_mean = np.mean(flux)
-f_mean_err = np.mean(flux_err)
+flux_flat = flux.ravel()
+flux_err_flat = flux_err.ravel()
 
-f_max = flux.max()
-f_max_err = flux_err[flux.argmax()]
-f_min = flux.min()
-f_min_err = flux_err[flux.argmin()]
+idx_max = flux_flat.argmax()
+idx_min = flux_flat.argmin()
+
+f_max, f_min = flux_flat[idx_max], flux_flat[idx_min]
+f_max_err, f_min_err = flux_err_flat[idx_max], flux_err_flat[idx_min]
+
+f_mean = flux_flat.mean()
+f_mean_err = flux_err_flat.mean()
+f_std = flux_flat.std(ddof=1)
 
 amplitude_maximum_variation = (f_max - f_max_err) - (f_min + f_min_err)
 
-amplitude_maximum_significance = amplitude_maximum_variation / np.sqrt(
-    f_max_err**2 + f_min_err**2
+amplitude_maximum_significance = amplitude_maximum_variation / np.hypot(
+    f_max_err, f_min_err
 )
 
 print(amplitude_maximum_significance)
@@ -105,9 +110,7 @@ print(amplitude_maximum_significance)
 relative_variability_amplitude = (f_max - f_min) / (f_max + f_min)
 
 relative_variability_error = (
-    2
-    * np.sqrt((f_max * f_min_err) ** 2 + (f_min * f_max_err) ** 2)
-    / (f_max + f_min) ** 2
+    2 * np.hypot(f_max * f_min_err, f_min * f_max_err) / (f_max + f_min) ** 2
 )
 
 relative_variability_significance = (
@@ -119,18 +122,22 @@ print(relative_variability_significance)
 ######################################################################
 # The variability amplitude as presented in `Heidt & Wagner, 1996 <https://ui.adsabs.harvard.edu/abs/1996A%26A...305...42H/abstract>`__ is:
 
-variability_amplitude = np.sqrt((f_max - f_min) ** 2 - 2 * f_mean_err**2)
+variability_amplitude = np.sqrt(
+    np.maximum(0.0, (f_max - f_min) ** 2 - 2 * f_mean_err**2)
+)
 
-variability_amplitude_100 = 100 * variability_amplitude / f_mean
+inv_mean = 1 / f_mean
+va = variability_amplitude * inv_mean
+variability_amplitude_100 = 100 * va
 
 variability_amplitude_error = (
     100
-    * ((f_max - f_min) / (f_mean * variability_amplitude_100 / 100))
+    * (f_max - f_min)
+    * inv_mean
+    / va
     * np.sqrt(
-        (f_max_err / f_mean) ** 2
-        + (f_min_err / f_mean) ** 2
-        + ((np.std(flux, ddof=1) / np.sqrt(len(flux))) / (f_max - f_mean)) ** 2
-        * (variability_amplitude_100 / 100) ** 4
+        (f_max_err**2 + f_min_err**2) * inv_mean**2
+        + ((f_std / np.sqrt(len(flux_flat))) / (f_max - f_mean)) ** 2 * va**4
     )
 )
 
@@ -182,11 +189,13 @@ print(dtime_table)
 #
 # By passing the flux and error on the flux as ``measures`` to the method we can obtain the list of optimal bin edges
 # defined by the bayesian blocks algorithm.
+#
+# This relies on the ``astropy>=5.0`` minimum version already required by Gammapy.
 
-time = lc_1d.geom.axes["time"].time_mid.mjd
+time = lc_1d.geom.axes["time"].time_mid_mjd
 
 bayesian_edges = bayesian_blocks(
-    t=time, x=flux.flatten(), sigma=flux_err.flatten(), fitness="measures"
+    t=time, x=flux_flat, sigma=flux_err_flat, fitness="measures"
 )
 
 ######################################################################
@@ -126,15 +126,15 @@ print(f"Number of selected observations : {len(observations)}")
 # Define time intervals
 # ---------------------
 #
-# We create the list of time intervals. Each time interval is an
-# `astropy.time.Time` object, containing a start and stop time.
+# We create the time intervals as a single `astropy.time.Time` array
+# of shape (N, 2), where each row contains a start and stop time.
 #
 
 t0 = Time("2006-07-29T20:30")
 duration = 10 * u.min
 n_time_bins = 35
 times = t0 + np.arange(n_time_bins) * duration
-time_intervals = [Time([tstart, tstop]) for tstart, tstop in zip(times[:-1], times[1:])]
+time_intervals = np.stack([times[:-1], times[1:]], axis=1)
 print(time_intervals[0].mjd)
 
 
@@ -223,16 +223,18 @@ safe_mask_masker = SafeMaskMaker(methods=["aeff-max"], aeff_percent=10)
 #
 
 # %%time
-datasets = Datasets()
+datasets = [None] * len(short_observations)
 
 dataset_empty = SpectrumDataset.create(geom=geom, energy_axis_true=energy_axis_true)
 
-for obs in short_observations:
-    dataset = dataset_maker.run(dataset_empty.copy(), obs)
+for idx, obs in enumerate(short_observations):
+    dataset = dataset_maker.run(SpectrumDataset.empty_like(dataset_empty), obs)
 
     dataset_on_off = bkg_maker.run(dataset, obs)
     dataset_on_off = safe_mask_masker.run(dataset_on_off, obs)
-    datasets.append(dataset_on_off)
+    datasets[idx] = dataset_on_off
+
+datasets = Datasets(datasets)
 
 
 ######################################################################
@@ -1,52 +1,81 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-"""Source catalogs."""
-from gammapy.utils.registry import Registry
+"""Source catalogs.
+
+The catalog classes are imported lazily on first access, so that only
+the sub-module of the requested catalog is loaded. ``CATALOG_REGISTRY``,
+the registry of source catalogs in Gammapy, is likewise created lazily
+on first access.
+"""
+import importlib
 from .core import SourceCatalog, SourceCatalogObject
-from .fermi import (
-    SourceCatalog2FHL,
-    SourceCatalog2PC,
-    SourceCatalog3FGL,
-    SourceCatalog3FHL,
-    SourceCatalog3PC,
-    SourceCatalog4FGL,
-    SourceCatalogObject2FHL,
-    SourceCatalogObject2PC,
-    SourceCatalogObject3FGL,
-    SourceCatalogObject3FHL,
-    SourceCatalogObject3PC,
-    SourceCatalogObject4FGL,
-)
-from .gammacat import SourceCatalogGammaCat, SourceCatalogObjectGammaCat
-from .hawc import (
-    SourceCatalog2HWC,
-    SourceCatalog3HWC,
-    SourceCatalogObject2HWC,
-    SourceCatalogObject3HWC,
-)
-from .hess import (
-    SourceCatalogHGPS,
-    SourceCatalogLargeScaleHGPS,
-    SourceCatalogObjectHGPS,
-    SourceCatalogObjectHGPSComponent,
-)
-from .lhaaso import SourceCatalog1LHAASO, SourceCatalogObject1LHAASO
 
-CATALOG_REGISTRY = Registry(
-    [
-        SourceCatalogGammaCat,
-        SourceCatalogHGPS,
-        SourceCatalog2HWC,
-        SourceCatalog3FGL,
-        SourceCatalog4FGL,
-        SourceCatalog2FHL,
-        SourceCatalog3FHL,
-        SourceCatalog3PC,
-        SourceCatalog3HWC,
-        SourceCatalog2PC,
-        SourceCatalog1LHAASO,
-    ]
-)
-"""Registry of source catalogs in Gammapy."""
+_MODULE_MAP = {
+    "SourceCatalog2FHL": ".fermi",
+    "SourceCatalog2PC": ".fermi",
+    "SourceCatalog3FGL": ".fermi",
+    "SourceCatalog3FHL": ".fermi",
+    "SourceCatalog3PC": ".fermi",
+    "SourceCatalog4FGL": ".fermi",
+    "SourceCatalogObject2FHL": ".fermi",
+    "SourceCatalogObject2PC": ".fermi",
+    "SourceCatalogObject3FGL": ".fermi",
+    "SourceCatalogObject3FHL": ".fermi",
+    "SourceCatalogObject3PC": ".fermi",
+    "SourceCatalogObject4FGL": ".fermi",
+    "SourceCatalogGammaCat": ".gammacat",
+    "SourceCatalogObjectGammaCat": ".gammacat",
+    "SourceCatalog2HWC": ".hawc",
+    "SourceCatalog3HWC": ".hawc",
+    "SourceCatalogObject2HWC": ".hawc",
+    "SourceCatalogObject3HWC": ".hawc",
+    "SourceCatalogHGPS": ".hess",
+    "SourceCatalogLargeScaleHGPS": ".hess",
+    "SourceCatalogObjectHGPS": ".hess",
+    "SourceCatalogObjectHGPSComponent": ".hess",
+    "SourceCatalog1LHAASO": ".lhaaso",
+    "SourceCatalogObject1LHAASO": ".lhaaso",
+}
+
+_CATALOG_REGISTRY_NAMES = [
+    "SourceCatalogGammaCat",
+    "SourceCatalogHGPS",
+    "SourceCatalog2HWC",
+    "SourceCatalog3FGL",
+    "SourceCatalog4FGL",
+    "SourceCatalog2FHL",
+    "SourceCatalog3FHL",
+    "SourceCatalog3PC",
+    "SourceCatalog3HWC",
+    "SourceCatalog2PC",
+    "SourceCatalog1LHAASO",
+]
+
+
+def _make_catalog_registry():
+    """Build the catalog registry."""
+    from gammapy.utils.registry import Registry
+
+    return Registry([__getattr__(name) for name in _CATALOG_REGISTRY_NAMES])
+
+
+def __getattr__(name):
+    # Import catalog classes and create CATALOG_REGISTRY, the registry of
+    # source catalogs, on first access and cache them in the module namespace.
+    if name not in _ALL_SET:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name == "CATALOG_REGISTRY":
+        value = _make_catalog_registry()
+    else:
+        module = importlib.import_module(_MODULE_MAP[name], __name__)
+        value = getattr(module, name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(_ALL_SET.union(globals()))
 
 
 __all__ = [
@@ -78,3 +107,5 @@ __all__ = [
     "SourceCatalogObjectHGPS",
     "SourceCatalogObjectHGPSComponent",
 ]
+
+_ALL_SET = frozenset(__all__)
@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import subprocess
+import sys
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -105,3 +107,36 @@ class TestSourceCatalogObject:
         position = self.source.position
         assert_allclose(position.ra.deg, 43.3)
         assert_allclose(position.dec.deg, 2)
+
+
+def test_catalog_lazy_import():
+    import gammapy.catalog
+    from gammapy.catalog import CATALOG_REGISTRY, SourceCatalog4FGL
+
+    assert CATALOG_REGISTRY.get_cls("4fgl") is SourceCatalog4FGL
+    assert len(CATALOG_REGISTRY) == 11
+    assert set(gammapy.catalog.__all__) <= set(dir(gammapy.catalog))
+
+    with pytest.raises(AttributeError):
+        gammapy.catalog.SourceCatalogDoesNotExist
+
+
+def test_catalog_lazy_import_submodules():
+    # run in a fresh interpreter, other tests already imported the sub-modules
+    code = """
+import sys
+import gammapy.catalog
+
+assert "gammapy.catalog.fermi" not in sys.modules
+assert "gammapy.catalog.hess" not in sys.modules
+
+from gammapy.catalog import SourceCatalog4FGL
+
+assert "gammapy.catalog.fermi" in sys.modules
+for name in ["hess", "hawc", "gammacat"]:
+    assert "gammapy.catalog." + name not in sys.modules, name
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -287,8 +287,9 @@ class GTI:
 
         Parameters
         ----------
-        time_intervals : list of `~astropy.time.Time` objects
-            Time intervals.
+        time_intervals : list of `~astropy.time.Time` objects or `~astropy.time.Time`
+            Time intervals, either as a list of start and stop times or as a
+            single `~astropy.time.Time` of shape (N, 2).
         reference_time : `~astropy.time.Time`, optional
             Reference time to use in GTI definition. Default is None.
             If None, use TIME_REF_DEFAULT.
@@ -298,8 +299,11 @@ class GTI:
         gti : `GTI`
             GTI table.
         """
-        start = Time([_[0] for _ in time_intervals])
-        stop = Time([_[1] for _ in time_intervals])
+        if isinstance(time_intervals, Time):
+            start, stop = time_intervals[:, 0], time_intervals[:, 1]
+        else:
+            start = Time([_[0] for _ in time_intervals])
+            stop = Time([_[1] for _ in time_intervals])
 
         if reference_time is None:
             reference_time = TIME_REF_DEFAULT
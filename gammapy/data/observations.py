@@ -719,6 +719,8 @@ class Observations(collections.abc.MutableSequence):
         ----------
         time_intervals : `astropy.time.Time` or list of `astropy.time.Time`
             List of start and stop time of the time intervals or one time interval.
+            Several time intervals can also be given as a single `astropy.time.Time`
+            of shape (N, 2), holding the start and stop time of each interval.
 
         Returns
         -------
@@ -726,7 +728,7 @@ class Observations(collections.abc.MutableSequence):
             A new Observations instance of the specified time intervals.
         """
         new_obs_list = []
-        if isinstance(time_intervals, Time):
+        if isinstance(time_intervals, Time) and time_intervals.ndim < 2:
             time_intervals = [time_intervals]
 
         for time_interval in time_intervals:
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.table import QTable, Table
@@ -264,3 +265,17 @@ def test_gti_from_time():
 
     assert_time_allclose(gti.table["START"], start)
     assert_time_allclose(gti.table["STOP"], stop)
+
+
+def test_gti_from_time_intervals():
+    start = Time(["2020-01-01T20:00:00", "2020-01-01T21:00:00"])
+    stop = Time(["2020-01-01T20:15:00", "2020-01-01T21:15:00"])
+    time_intervals = [Time([tstart, tstop]) for tstart, tstop in zip(start, stop)]
+
+    gti = GTI.from_time_intervals(time_intervals)
+    gti_array = GTI.from_time_intervals(np.stack([start, stop], axis=1))
+
+    assert len(gti_array.table) == 2
+    assert_time_allclose(gti_array.time_start, gti.time_start)
+    assert_time_allclose(gti_array.time_stop, gti.time_stop)
+    assert_time_allclose(gti_array.time_stop, stop)
@@ -230,6 +230,11 @@ def test_observations_select_time_time_intervals_list(data_store):
     assert_time_allclose(new_obss[1].gti.time_start[0], time_intervals[1][0])
     assert_time_allclose(new_obss[1].gti.time_stop[-1], time_intervals[1][1])
 
+    new_obss_array = obss.select_time(np.stack(time_intervals))
+
+    assert len(new_obss_array) == 2
+    assert_time_allclose(new_obss_array[1].gti.time_stop[-1], time_intervals[1][1])
+
 
 @requires_data()
 def test_observation_cta_1dc():
@@ -138,11 +138,11 @@ class Datasets(collections.abc.MutableSequence):
         elif not isinstance(datasets, list):
             raise TypeError(f"Invalid type: {datasets!r}")
 
-        unique_names = []
+        unique_names = set()
         for dataset in datasets:
             if dataset.name in unique_names:
                 raise (ValueError("Dataset names must be unique"))
-            unique_names.append(dataset.name)
+            unique_names.add(dataset.name)
 
         self._datasets = datasets
         self._covariance = None
@@ -183,10 +183,35 @@ class Datasets(collections.abc.MutableSequence):
         Duplicate model objects have been removed.
         The order of the unique models remains.
         """
-        if models:
-            self._covariance = DatasetModels(models).covariance
-        for dataset in self:
-            dataset.models = models
+        if not models:
+            for dataset in self:
+                dataset.models = models
+            return
+
+        models = DatasetModels(models)
+        self._covariance = models.covariance
+
+        for dataset, dataset_models in zip(self, self._split_models(models)):
+            dataset.models = dataset_models
+
+    def _split_models(self, models):
+        """Split models into the models of each dataset, keeping their order."""
+        names = self.names
+        selected = {name: [] for name in names}
+
+        for model in models:
+            datasets_names = model.datasets_names
+
+            if datasets_names is None:
+                datasets_names = names
+            elif isinstance(datasets_names, str):
+                datasets_names = [datasets_names]
+
+            for name in set(datasets_names):
+                if name in selected:
+                    selected[name].append(model)
+
+        return [DatasetModels(selected[name]) for name in names]
 
     @property
     def names(self):
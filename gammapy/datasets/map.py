@@ -284,6 +284,17 @@ def create_map_dataset_from_observation(
     return dataset
 
 
+def _empty_irf_map(irf):
+    """Create a zero filled IRF map with the same geometries as the input IRF map."""
+    exposure_map = None
+
+    if irf.exposure_map is not None:
+        exposure_map = Map.from_geom(irf.exposure_map.geom, unit=irf.exposure_map.unit)
+
+    irf_map = Map.from_geom(irf._irf_map.geom, unit=irf._irf_map.unit)
+    return irf.__class__(irf_map, exposure_map)
+
+
 class MapDataset(Dataset):
     """Main map dataset for likelihood fitting.
 
@@ -412,6 +423,7 @@ class MapDataset(Dataset):
         self.exposure = exposure
         self.background = background
         self._background_cached = None
+        self._background_cached_input = None
         self._background_parameters_cached = None
 
         self.mask_fit = mask_fit
@@ -662,9 +674,16 @@ class MapDataset(Dataset):
             Predicted counts from the background.
         """
         background = self.background
-        if self.background_model and background:
-            if self._background_parameters_changed:
-                values = self.background_model.evaluate_geom(geom=self.background.geom)
+        background_model = self.background_model
+        if background_model and background:
+            if background is not self._background_cached_input:
+                self._background_cached = None
+                self._background_cached_input = background
+
+            parameters_changed = self._background_parameters_changed()
+
+            if parameters_changed or self._background_cached is None:
+                values = background_model.evaluate_geom(geom=background.geom)
                 if self._background_cached is None:
                     self._background_cached = background * values
                 else:
@@ -883,6 +902,54 @@ class MapDataset(Dataset):
             reference_time=reference_time, name=name, meta_table=meta_table, **kwargs
         )
 
+    @classmethod
+    def empty_like(cls, dataset, name=None):
+        """Create a dataset with zero filled maps and the same geometries as the input dataset.
+
+        The geometries of the input dataset are reused as they are and only zero
+        filled data arrays are allocated, so no geometry is recomputed and no data
+        is copied. Unlike `from_geoms`, the IRF maps are zero filled as well.
+
+        Parameters
+        ----------
+        dataset : `MapDataset`
+            Dataset whose geometries are used.
+        name : str, optional
+            Name of the returned dataset. Default is None.
+
+        Returns
+        -------
+        empty_maps : `MapDataset`
+            A dataset containing zero filled maps.
+        """
+        geom = dataset._geom
+        kwargs = {
+            "name": make_name(name),
+            "counts": Map.from_geom(geom, unit=""),
+            "background": Map.from_geom(geom, unit=""),
+            "mask_safe": Map.from_geom(geom, unit="", dtype=bool),
+        }
+
+        if dataset.exposure is not None:
+            kwargs["exposure"] = Map.from_geom(
+                dataset.exposure.geom, unit=dataset.exposure.unit
+            )
+
+        if dataset.edisp is not None:
+            kwargs["edisp"] = _empty_irf_map(dataset.edisp)
+
+        if dataset.psf is not None:
+            kwargs["psf"] = _empty_irf_map(dataset.psf)
+
+        if dataset.gti is not None:
+            kwargs["gti"] = GTI(
+                dataset.gti.table[:0], reference_time=dataset.gti.time_ref
+            )
+        else:
+            kwargs["gti"] = GTI.create([] * u.s, [] * u.s, reference_time="2000-01-01")
+
+        return cls(**kwargs)
+
     @property
     def mask_safe_image(self):
         """Reduced safe mask."""
@@ -2477,6 +2544,31 @@ class MapDatasetOnOff(MapDataset):
 
         return cls.from_map_dataset(dataset, name=name, **off_maps)
 
+    @classmethod
+    def empty_like(cls, dataset, name=None):
+        """Create an on-off dataset with zero filled maps and the same geometries as the input dataset.
+
+        Parameters
+        ----------
+        dataset : `MapDataset`
+            Dataset whose geometries are used.
+        name : str, optional
+            Name of the returned dataset. Default is None.
+
+        Returns
+        -------
+        empty_maps : `MapDatasetOnOff`
+            A MapDatasetOnOff containing zero filled maps.
+        """
+        dataset = MapDataset.empty_like(dataset, name=name)
+
+        off_maps = {}
+
+        for key in ["counts_off", "acceptance", "acceptance_off"]:
+            off_maps[key] = Map.from_geom(dataset._geom, unit="")
+
+        return cls.from_map_dataset(dataset, name=dataset.name, **off_maps)
+
     @classmethod
     def from_map_dataset(
         cls, dataset, acceptance, acceptance_off, counts_off=None, name=None
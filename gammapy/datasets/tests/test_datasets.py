@@ -4,11 +4,16 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
 from astropy.coordinates import SkyCoord
-from gammapy.datasets import Datasets, SpectrumDatasetOnOff
+from gammapy.datasets import Datasets, SpectrumDataset, SpectrumDatasetOnOff
 from gammapy.datasets.tests.test_map import get_map_dataset
-from gammapy.maps import MapAxis, WcsGeom
+from gammapy.maps import MapAxis, RegionGeom, WcsGeom
 from gammapy.modeling import Fit
-from gammapy.modeling.models import FoVBackgroundModel, Models, SkyModel
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    Models,
+    PowerLawSpectralModel,
+    SkyModel,
+)
 from gammapy.modeling.tests.test_fit import MyDataset
 from gammapy.utils.testing import requires_data
 
@@ -77,6 +82,31 @@ def test_datasets_mutation():
         dats.extend(dats2)
 
 
+def test_datasets_models_setter():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+    datasets = Datasets(
+        [SpectrumDataset.create(geom, name=name) for name in ["d1", "d2"]]
+    )
+
+    models = Models(
+        [
+            SkyModel(PowerLawSpectralModel(), name="m1", datasets_names=["d2"]),
+            SkyModel(PowerLawSpectralModel(), name="m2"),
+            SkyModel(PowerLawSpectralModel(), name="m3", datasets_names=["d1", "d2"]),
+            SkyModel(PowerLawSpectralModel(), name="m4", datasets_names=["d3"]),
+        ]
+    )
+    datasets.models = models
+
+    assert datasets["d1"].models.names == ["m2", "m3"]
+    assert datasets["d2"].models.names == ["m1", "m2", "m3"]
+    assert datasets.models.names == ["m2", "m3", "m1"]
+
+    datasets.models = None
+    assert datasets["d1"].models is None
+
+
 @requires_data()
 def test_datasets_info_table():
     datasets_hess = Datasets()
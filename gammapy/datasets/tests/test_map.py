@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import json
 import warnings
+from unittest import mock
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
@@ -953,6 +954,70 @@ def test_create_with_migra(tmp_path):
     assert dataset_new.edisp.edisp_map.data.shape == (3, 50, 10, 10)
 
 
+def test_map_dataset_empty_like():
+    rad_axis = MapAxis(nodes=np.linspace(0.0, 1.0, 51), unit="deg", name="rad")
+    e_reco = MapAxis.from_edges(
+        np.logspace(-1.0, 1.0, 3), name="energy", unit=u.TeV, interp="log"
+    )
+    e_true = MapAxis.from_edges(
+        np.logspace(-1.0, 1.0, 4), name="energy_true", unit=u.TeV, interp="log"
+    )
+    geom = WcsGeom.create(binsz=0.02, width=(2, 2), axes=[e_reco])
+    dataset = MapDataset.create(
+        geom=geom,
+        energy_axis_true=e_true,
+        rad_axis=rad_axis,
+        reference_time="2010-01-01",
+    )
+    dataset.counts.data += 1
+    dataset.exposure.data += 1
+
+    empty = MapDataset.empty_like(dataset, name="empty")
+
+    assert isinstance(empty, MapDataset)
+    assert empty.name == "empty"
+    assert empty.counts.geom is dataset.counts.geom
+    assert empty.exposure.geom is dataset.exposure.geom
+    assert empty.exposure.unit == dataset.exposure.unit
+    assert isinstance(empty.edisp, EDispKernelMap)
+    assert empty.edisp.edisp_map.geom is dataset.edisp.edisp_map.geom
+    assert empty.edisp.exposure_map.geom is dataset.edisp.exposure_map.geom
+    assert isinstance(empty.psf, PSFMap)
+    assert empty.psf.psf_map.geom is dataset.psf.psf_map.geom
+
+    assert_allclose(empty.counts.data, 0)
+    assert_allclose(empty.exposure.data, 0)
+    assert_allclose(empty.psf.psf_map.data, 0)
+    assert_allclose(empty.edisp.edisp_map.data, 0)
+    assert_allclose(empty.mask_safe, 0)
+    assert len(empty.gti.table) == 0
+    assert_allclose(empty.gti.time_ref.mjd, dataset.gti.time_ref.mjd)
+    assert_allclose(dataset.counts.data.sum(), 20000)
+
+
+def test_map_dataset_on_off_empty_like():
+    e_reco = MapAxis.from_edges(
+        np.logspace(-1.0, 1.0, 3), name="energy", unit=u.TeV, interp="log"
+    )
+    e_true = MapAxis.from_edges(
+        np.logspace(-1.0, 1.0, 4), name="energy_true", unit=u.TeV, interp="log"
+    )
+    geom = WcsGeom.create(binsz=0.02, width=(2, 2), axes=[e_reco])
+    dataset = MapDatasetOnOff.create(geom=geom, energy_axis_true=e_true)
+    dataset.counts_off.data += 1
+
+    empty = MapDatasetOnOff.empty_like(dataset, name="empty")
+
+    assert isinstance(empty, MapDatasetOnOff)
+    assert empty.name == "empty"
+    assert empty.counts_off.geom is dataset.counts.geom
+    assert_allclose(empty.counts_off.data, 0)
+    assert_allclose(empty.acceptance.data, 0)
+    assert_allclose(empty.acceptance_off.data, 0)
+    assert empty.edisp.edisp_map.geom is dataset.edisp.edisp_map.geom
+    assert_allclose(dataset.counts_off.data.sum(), 20000)
+
+
 def test_create_high_dimension():
     # tests empty datasets created with additional axes
     label_axis = LabelMapAxis(["a", "b"], name="type")
@@ -1266,6 +1331,36 @@ def test_npred_psf_after_edisp():
     assert_allclose(npred.data.sum(), 129553.858658)
 
 
+def test_npred_background_cache():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(width=1 * u.deg, binsz=0.1, axes=[energy_axis])
+    dataset = MapDataset.create(geom=geom, name="test")
+    dataset.background.data += 1
+
+    bkg_model = FoVBackgroundModel(dataset_name="test")
+    dataset.models = [bkg_model]
+
+    with mock.patch.object(
+        bkg_model, "evaluate_geom", wraps=bkg_model.evaluate_geom
+    ) as evaluate_geom:
+        npred = dataset.npred_background()
+        assert_allclose(npred.data.sum(), 300)
+
+        npred = dataset.npred_background()
+        assert evaluate_geom.call_count == 1
+        assert_allclose(npred.data.sum(), 300)
+
+        bkg_model.spectral_model.norm.value = 2
+        npred = dataset.npred_background()
+        assert evaluate_geom.call_count == 2
+        assert_allclose(npred.data.sum(), 600)
+
+        dataset.background = dataset.background * 3
+        npred = dataset.npred_background()
+        assert evaluate_geom.call_count == 3
+        assert_allclose(npred.data.sum(), 1800)
+
+
 def get_map_dataset_onoff(images, **kwargs):
     """Returns a MapDatasetOnOff"""
     mask_geom = images["counts"].geom
@@ -211,6 +211,38 @@ def test_spectrum_dataset_create():
     assert_allclose(empty_spectrum_dataset.mask_safe, 0)
 
 
+def test_spectrum_dataset_empty_like():
+    e_reco = MapAxis.from_edges(u.Quantity([0.1, 1, 10.0], "TeV"), name="energy")
+    e_true = MapAxis.from_edges(
+        u.Quantity([0.05, 0.5, 5, 20.0], "TeV"), name="energy_true"
+    )
+    geom = RegionGeom(region=None, axes=[e_reco])
+    dataset = SpectrumDataset.create(geom, energy_axis_true=e_true)
+    dataset.counts.data += 1
+    dataset.exposure.data += 1
+
+    empty = SpectrumDataset.empty_like(dataset, name="empty")
+
+    assert empty.name == "empty"
+    assert empty.counts.geom is dataset.counts.geom
+    assert empty.exposure.geom is dataset.exposure.geom
+    assert empty.edisp.edisp_map.geom is dataset.edisp.edisp_map.geom
+    assert empty.edisp.exposure_map.geom is dataset.edisp.exposure_map.geom
+    assert empty.counts.data.sum() == 0
+    assert empty.exposure.data.sum() == 0
+    assert len(empty.gti.table) == 0
+    assert_allclose(empty.mask_safe, 0)
+    assert dataset.counts.data.sum() == 2
+
+    empty_on_off = SpectrumDatasetOnOff.empty_like(dataset, name="empty-on-off")
+
+    assert isinstance(empty_on_off, SpectrumDatasetOnOff)
+    assert empty_on_off.name == "empty-on-off"
+    assert empty_on_off.counts_off.geom is dataset.counts.geom
+    assert empty_on_off.counts_off.data.sum() == 0
+    assert empty_on_off.edisp.edisp_map.geom is dataset.edisp.edisp_map.geom
+
+
 def test_spectrum_dataset_stack_diagonal_safe_mask(spectrum_dataset):
     geom = spectrum_dataset.counts.geom
 
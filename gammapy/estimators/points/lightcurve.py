@@ -37,8 +37,9 @@ class LightCurveEstimator(FluxPointsEstimator):
 
     Parameters
     ----------
-    time_intervals : list of `astropy.time.Time`
-        Start and stop time for each interval to compute the LC.
+    time_intervals : list of `astropy.time.Time` or `astropy.time.Time`
+        Start and stop time for each interval to compute the LC. A single
+        `astropy.time.Time` of shape (N, 2) is also supported.
     source : str or int
         For which source in the model to compute the flux points. Default is 0.
     atol : `~astropy.units.Quantity`
@@ -130,23 +131,60 @@ class LightCurveEstimator(FluxPointsEstimator):
         lightcurve : `~gammapy.estimators.FluxPoints`
             Light curve flux points.
         """
+        return self._run(datasets, time_intervals=self.time_intervals, cache={})
+
+    def run_batched(self, datasets, time_intervals_list):
+        """Run light curve extraction for several sets of time intervals.
+
+        Time intervals that appear in more than one set are only estimated once,
+        e.g. when re-running the estimation on merged Bayesian blocks intervals
+        that partly coincide with the original ones.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.SpectrumDataset` or `~gammapy.datasets.MapDataset`
+            Spectrum or Map datasets.
+        time_intervals_list : list of list of `astropy.time.Time`
+            Sets of start and stop times, one light curve is computed for each set.
+            If a set is None, the time intervals defined by the datasets GTIs are used.
+
+        Returns
+        -------
+        lightcurves : list of `~gammapy.estimators.FluxPoints`
+            Light curve flux points, one for each set of time intervals.
+        """
+        cache = {}
+        return [
+            self._run(datasets, time_intervals=time_intervals, cache=cache)
+            for time_intervals in time_intervals_list
+        ]
+
+    def _run(self, datasets, time_intervals, cache):
         if not isinstance(datasets, DatasetsActor):
             datasets = Datasets(datasets)
 
-        if self.time_intervals is None:
+        if time_intervals is None:
             gti = datasets.gti
         else:
-            gti = GTI.from_time_intervals(self.time_intervals)
+            gti = GTI.from_time_intervals(time_intervals)
 
         gti = gti.union(overlap_ok=False, merge_equal=False)
 
-        rows = []
+        keys = []
         valid_intervals = []
         parallel_datasets = []
+        parallel_keys = []
         dataset_names = datasets.names
         for t_min, t_max in progress_bar(
             gti.time_intervals, desc="Time intervals selection"
         ):
+            key = (t_min.mjd, t_max.mjd)
+
+            if key in cache:
+                keys.append(key)
+                valid_intervals.append([t_min, t_max])
+                continue
+
             datasets_to_fit = datasets.select_time(
                 time_min=t_min, time_max=t_max, atol=self.atol
             )
@@ -157,15 +195,16 @@ class LightCurveEstimator(FluxPointsEstimator):
                 )
                 continue
 
+            keys.append(key)
             valid_intervals.append([t_min, t_max])
 
             if self.n_jobs == 1:
-                fp = self.estimate_time_bin_flux(datasets_to_fit, dataset_names)
-                rows.append(fp)
+                cache[key] = self.estimate_time_bin_flux(datasets_to_fit, dataset_names)
             else:
                 parallel_datasets.append(datasets_to_fit)
+                parallel_keys.append(key)
 
-        if self.n_jobs > 1:
+        if parallel_datasets:
             self._update_child_jobs()
             rows = parallel.run_multiprocessing(
                 self.estimate_time_bin_flux,
@@ -177,6 +216,9 @@ class LightCurveEstimator(FluxPointsEstimator):
                 pool_kwargs=dict(processes=self.n_jobs),
                 task_name="Time intervals",
             )
+            cache.update(zip(parallel_keys, rows))
+
+        rows = [cache[key] for key in keys]
 
         if len(rows) == 0:
             raise ValueError("LightCurveEstimator: No datasets in time intervals")
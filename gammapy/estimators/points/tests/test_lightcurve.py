@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from unittest import mock
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -511,6 +512,43 @@ def test_lightcurve_estimator_spectrum_datasets_largerbin():
     assert_allclose(table["ts"][0], [742.939324], rtol=1e-4)
 
 
+def test_lightcurve_estimator_run_batched():
+    datasets = get_spectrum_datasets()
+    time_intervals = [
+        Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
+        Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
+    ]
+    time_intervals_merged = [Time(["2010-01-01T00:00:00", "2010-01-01T02:00:00"])]
+    time_intervals_list = [time_intervals, time_intervals[1:], time_intervals_merged]
+
+    estimator = LightCurveEstimator(energy_edges=[1, 30] * u.TeV)
+
+    with mock.patch.object(
+        estimator, "estimate_time_bin_flux", wraps=estimator.estimate_time_bin_flux
+    ) as estimate_time_bin_flux:
+        results = estimator.run_batched(datasets, time_intervals_list)
+
+    # the second set only contains a bin of the first one
+    assert estimate_time_bin_flux.call_count == 3
+
+    for result, intervals in zip(results, time_intervals_list):
+        expected = LightCurveEstimator(
+            energy_edges=[1, 30] * u.TeV, time_intervals=intervals
+        ).run(datasets)
+        assert_allclose(result.norm.data, expected.norm.data)
+
+    assert_allclose(results[2].norm.data.squeeze(), 0.909646, rtol=1e-3)
+
+    with mock.patch.object(
+        estimator, "estimate_time_bin_flux", wraps=estimator.estimate_time_bin_flux
+    ) as estimate_time_bin_flux:
+        results = estimator.run_batched(datasets, [time_intervals, time_intervals])
+
+    assert estimate_time_bin_flux.call_count == 2
+    assert results[1].norm.data is not results[0].norm.data
+    assert_allclose(results[1].norm.data, results[0].norm.data)
+
+
 @requires_data()
 def test_lightcurve_estimator_spectrum_datasets_emptybin():
     # Test all dataset in a single LC bin, here two hours
@@ -384,6 +384,14 @@ def resample_energy_edges(dataset, conditions={}):
     return u.Quantity(energy_edges[::-1])
 
 
+def _get_lightcurve_flux(lightcurve, flux_quantity):
+    """Return the flux and flux error data arrays and the index of the time axis."""
+    flux = getattr(lightcurve, flux_quantity)
+    flux_err = getattr(lightcurve, flux_quantity + "_err")
+    time_id = flux.geom.axes.index_data("time")
+    return flux.data, flux_err.data, time_id
+
+
 def compute_lightcurve_fvar(lightcurve, flux_quantity="flux"):
     r"""Compute the fractional excess variance of the input lightcurve.
 
@@ -403,12 +411,9 @@ def compute_lightcurve_fvar(lightcurve, flux_quantity="flux"):
         Table of fractional excess variance and associated error for each energy bin of the lightcurve.
     """
 
-    flux = getattr(lightcurve, flux_quantity)
-    flux_err = getattr(lightcurve, flux_quantity + "_err")
-
-    time_id = flux.geom.axes.index_data("time")
+    flux, flux_err, time_id = _get_lightcurve_flux(lightcurve, flux_quantity)
 
-    fvar, fvar_err = compute_fvar(flux.data, flux_err.data, axis=time_id)
+    fvar, fvar_err = compute_fvar(flux, flux_err, axis=time_id)
 
     significance = fvar / fvar_err
 
@@ -440,12 +445,9 @@ def compute_lightcurve_fpp(lightcurve, flux_quantity="flux"):
         Table of point-to-point excess variance and associated error for each energy bin of the lightcurve.
     """
 
-    flux = getattr(lightcurve, flux_quantity)
-    flux_err = getattr(lightcurve, flux_quantity + "_err")
-
-    time_id = flux.geom.axes.index_data("time")
+    flux, flux_err, time_id = _get_lightcurve_flux(lightcurve, flux_quantity)
 
-    fpp, fpp_err = compute_fpp(flux.data, flux_err.data, axis=time_id)
+    fpp, fpp_err = compute_fpp(flux, flux_err, axis=time_id)
 
     significance = fpp / fpp_err
 
@@ -496,13 +498,10 @@ def compute_lightcurve_doublingtime(lightcurve, flux_quantity="flux"):
     https://academic.oup.com/mnras/article/431/1/824/1054498
     """
 
-    flux = getattr(lightcurve, flux_quantity)
-    flux_err = getattr(lightcurve, flux_quantity + "_err")
+    flux, flux_err, axis = _get_lightcurve_flux(lightcurve, flux_quantity)
     coords = lightcurve.geom.axes["time"].center
 
-    axis = flux.geom.axes.index_data("time")
-
-    doubling_dict = compute_flux_doubling(flux.data, flux_err.data, coords, axis=axis)
+    doubling_dict = compute_flux_doubling(flux, flux_err, coords, axis=axis)
 
     energies = lightcurve.geom.axes["energy"].edges
     table = Table(
@@ -2439,6 +2439,11 @@ class TimeMapAxis:
         """Return time bin center as a `~astropy.time.Time` object."""
         return self.time_min + 0.5 * self.time_delta
 
+    @lazyproperty
+    def time_mid_mjd(self):
+        """Time bin centers as MJD values in a `~numpy.ndarray`."""
+        return self.time_mid.mjd
+
     @property
     def time_edges(self):
         """Time edges as a `~astropy.time.Time` object."""
@@ -2497,7 +2502,7 @@ class TimeMapAxis:
         if self.time_format == "iso":
             center = self.time_mid.datetime
         else:
-            center = self.time_mid.mjd * u.day
+            center = self.time_mid_mjd * u.day
         return center
 
     def format_plot_xaxis(self, ax):
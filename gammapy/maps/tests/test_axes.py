@@ -413,6 +413,8 @@ def test_time_axis(time_intervals):
 
     assert_allclose(axis.time_delta.to_value("min"), 60)
     assert_allclose(axis.time_mid[0].mjd, 58927.020833333336)
+    assert_allclose(axis.time_mid_mjd, axis.time_mid.mjd)
+    assert axis.time_mid_mjd is axis.time_mid_mjd
 
     assert "time" in axis.__str__()
     assert "20" in axis.__str__()
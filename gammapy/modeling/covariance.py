@@ -23,6 +23,7 @@ class Covariance:
 
     def __init__(self, parameters, data=None):
         self.parameters = parameters
+        self._index = None
         if data is None:
             data = np.diag([p.error**2 for p in self.parameters])
 
@@ -105,6 +106,20 @@ class Covariance:
 
         return covar
 
+    def _get_indices(self, parameters):
+        """Position of the given parameters in the covariance parameters."""
+        if self._index is None or self._index[0] is not self.parameters:
+            index = {}
+            for idx, par in enumerate(self.parameters):
+                index.setdefault(par, idx)
+            self._index = (self.parameters, index)
+
+        index = self._index[1]
+        return [
+            index[par] if par in index else self.parameters.index(par)
+            for par in parameters
+        ]
+
     def get_subcovariance(self, parameters):
         """Get sub-covariance matrix.
 
@@ -118,7 +133,7 @@ class Covariance:
         covariance : `~numpy.ndarray`
             Sub-covariance.
         """
-        idx = [self.parameters.index(par) for par in parameters]
+        idx = self._get_indices(parameters)
         data = self._data[np.ix_(idx, idx)]
         return self.__class__(parameters=parameters, data=data)
 
@@ -134,7 +149,7 @@ class Covariance:
             # This copy is required to make the covariance setting work with ray
             self._data = self._data.copy()
 
-        idx = [self.parameters.index(par) for par in covar.parameters]
+        idx = self._get_indices(covar.parameters)
 
         if not np.allclose(self.data[np.ix_(idx, idx)], covar.data):
             self.data[idx, :] = 0
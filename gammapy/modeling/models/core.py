@@ -64,14 +64,15 @@ def _build_parameters_from_dict(data, default_parameters):
     """Build a `~gammapy.modeling.Parameters` object from input dictionary and default parameter values."""
     par_data = []
 
-    input_names = [_["name"] for _ in data]
+    input_data = {}
+    for par in data:
+        input_data.setdefault(par["name"], par)
 
     for par in default_parameters:
         par_dict = par.to_dict()
         try:
-            index = input_names.index(par_dict["name"])
-            par_dict.update(data[index])
-        except ValueError:
+            par_dict.update(input_data[par_dict["name"]])
+        except KeyError:
             log.warning(
                 f"Parameter '{par_dict['name']}' not defined in YAML file."
                 f" Using default value: {par_dict['value']} {par_dict['unit']}"
@@ -366,11 +367,11 @@ class DatasetModels(collections.abc.Sequence, CovarianceMixin):
         elif not isinstance(models, list):
             raise TypeError(f"Invalid type: {models!r}")
 
-        unique_names = []
+        unique_names = set()
 
         for model in models:
             _check_name_unique(model, names=unique_names)
-            unique_names.append(model.name)
+            unique_names.add(model.name)
 
         self._models = models
         self._covar_file = None
@@ -532,15 +533,15 @@ class DatasetModels(collections.abc.Sequence, CovarianceMixin):
 
     def update_link_label(self):
         """Update linked parameters labels used for serialisation and print."""
-        params_list = []
-        params_shared = []
+        params_seen = {}
+        params_shared = {}
         for param in self.parameters:
-            if param not in params_list:
-                params_list.append(param)
-                params_list.append(param)
-            elif param not in params_shared:
-                params_shared.append(param)
-        for param in params_shared:
+            key = id(param)
+            if key not in params_seen:
+                params_seen[key] = param
+            elif key not in params_shared:
+                params_shared[key] = param
+        for param in params_shared.values():
             param._link_label_io = param.name + "@" + make_name()
 
     def to_dict(self, full_output=False, overwrite_templates=False):
@@ -551,12 +552,9 @@ class DatasetModels(collections.abc.Sequence, CovarianceMixin):
         for model in self._models:
             model_data = model.to_dict(full_output)
             models_data.append(model_data)
-            if (
-                hasattr(model, "spatial_model")
-                and model.spatial_model is not None
-                and "template" in model.spatial_model.tag
-            ):
-                model.spatial_model.write(overwrite=overwrite_templates)
+            spatial_model = getattr(model, "spatial_model", None)
+            if spatial_model is not None and "template" in spatial_model.tag:
+                spatial_model.write(overwrite=overwrite_templates)
             if model.tag == "TemplateNPredModel":
                 model.write(overwrite=overwrite_templates)
 
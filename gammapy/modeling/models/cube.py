@@ -30,6 +30,15 @@ __all__ = [
 ]
 
 
+def _build_submodel(registry, model_type, data):
+    """Create a spectral, spatial or temporal model from its dictionary, if given."""
+    if data is None:
+        return None
+
+    model_class = registry.get_cls(data["type"])
+    return model_class.from_dict({model_type: data})
+
+
 class SkyModel(CovarianceMixin, ModelBase):
     """Sky model component.
 
@@ -491,24 +500,15 @@ class SkyModel(CovarianceMixin, ModelBase):
             TEMPORAL_MODEL_REGISTRY,
         )
 
-        model_class = SPECTRAL_MODEL_REGISTRY.get_cls(data["spectral"]["type"])
-        spectral_model = model_class.from_dict({"spectral": data["spectral"]})
-
-        spatial_data = data.get("spatial")
-
-        if spatial_data is not None:
-            model_class = SPATIAL_MODEL_REGISTRY.get_cls(spatial_data["type"])
-            spatial_model = model_class.from_dict({"spatial": spatial_data})
-        else:
-            spatial_model = None
-
-        temporal_data = data.get("temporal")
-
-        if temporal_data is not None:
-            model_class = TEMPORAL_MODEL_REGISTRY.get_cls(temporal_data["type"])
-            temporal_model = model_class.from_dict({"temporal": temporal_data})
-        else:
-            temporal_model = None
+        spectral_model = _build_submodel(
+            SPECTRAL_MODEL_REGISTRY, "spectral", data["spectral"]
+        )
+        spatial_model = _build_submodel(
+            SPATIAL_MODEL_REGISTRY, "spatial", data.get("spatial")
+        )
+        temporal_model = _build_submodel(
+            TEMPORAL_MODEL_REGISTRY, "temporal", data.get("temporal")
+        )
 
         return cls(
             name=data["name"],
@@ -797,19 +797,12 @@ class FoVBackgroundModel(ModelBase):
             SPECTRAL_MODEL_REGISTRY,
         )
 
-        spectral_data = data.get("spectral")
-        if spectral_data is not None:
-            model_class = SPECTRAL_MODEL_REGISTRY.get_cls(spectral_data["type"])
-            spectral_model = model_class.from_dict({"spectral": spectral_data})
-        else:
-            spectral_model = None
-
-        spatial_data = data.get("spatial")
-        if spatial_data is not None:
-            model_class = SPATIAL_MODEL_REGISTRY.get_cls(spatial_data["type"])
-            spatial_model = model_class.from_dict({"spatial": spatial_data})
-        else:
-            spatial_model = None
+        spectral_model = _build_submodel(
+            SPECTRAL_MODEL_REGISTRY, "spectral", data.get("spectral")
+        )
+        spatial_model = _build_submodel(
+            SPATIAL_MODEL_REGISTRY, "spatial", data.get("spatial")
+        )
 
         datasets_names = data.get("datasets_names")
 
@@ -1034,19 +1027,12 @@ class TemplateNPredModel(ModelBase):
             SPECTRAL_MODEL_REGISTRY,
         )
 
-        spectral_data = data.get("spectral")
-        if spectral_data is not None:
-            model_class = SPECTRAL_MODEL_REGISTRY.get_cls(spectral_data["type"])
-            spectral_model = model_class.from_dict({"spectral": spectral_data})
-        else:
-            spectral_model = None
-
-        spatial_data = data.get("spatial")
-        if spatial_data is not None:
-            model_class = SPATIAL_MODEL_REGISTRY.get_cls(spatial_data["type"])
-            spatial_model = model_class.from_dict({"spatial": spatial_data})
-        else:
-            spatial_model = None
+        spectral_model = _build_submodel(
+            SPECTRAL_MODEL_REGISTRY, "spectral", data.get("spectral")
+        )
+        spatial_model = _build_submodel(
+            SPATIAL_MODEL_REGISTRY, "spatial", data.get("spatial")
+        )
 
         if "filename" in data:
             bkg_map = Map.read(data["filename"])
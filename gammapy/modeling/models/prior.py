@@ -15,14 +15,15 @@ def _build_priorparameters_from_dict(data, default_parameters):
     """Build a `~gammapy.modeling.PriorParameters` object from input dictionary and default prior parameter values."""
     par_data = []
 
-    input_names = [_["name"] for _ in data]
+    input_data = {}
+    for par in data:
+        input_data.setdefault(par["name"], par)
 
     for par in default_parameters:
         par_dict = par.to_dict()
         try:
-            index = input_names.index(par_dict["name"])
-            par_dict.update(data[index])
-        except ValueError:
+            par_dict.update(input_data[par_dict["name"]])
+        except KeyError:
             log.warning(
                 f"PriorParameter '{par_dict['name']}' not defined in YAML file."
                 f" Using default value: {par_dict['value']} {par_dict['unit']}"
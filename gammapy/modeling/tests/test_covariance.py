@@ -50,6 +50,17 @@ def test_get_subcovariance(covariance_diagonal, covariance):
     assert_allclose(np.diag(covar), [0.1**2, 0.2**2])
 
 
+def test_get_subcovariance_by_name(covariance_diagonal):
+    covar = covariance_diagonal.get_subcovariance(["z", "x"])
+    assert_allclose(np.diag(covar), [0.3**2, 0.1**2])
+
+    parameters = covariance_diagonal.parameters
+    covariance_diagonal.parameters = Parameters([parameters["z"], parameters["x"]])
+    covariance_diagonal.data = np.diag([0.3**2, 0.1**2])
+    covar = covariance_diagonal.get_subcovariance(Parameters([parameters["x"]]))
+    assert_allclose(covar.data, [[0.1**2]])
+
+
 def test_scipy_mvn(covariance):
     # Adapt test because scipy 1.9.3 does not work with semi positive matrices of rank one
     mvn = Covariance(covariance.parameters, np.array([[1, 0.5], [0.5, 1]])).scipy_mvn
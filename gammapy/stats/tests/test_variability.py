@@ -81,6 +81,11 @@ def test_lightcurve_fvar():
     assert_allclose(fvar, [0.68322763, 0.84047606])
     assert_allclose(fvar_err, [0.06679978, 0.08285806])
 
+    fvar_t, fvar_err_t = compute_fvar(flux.T, flux_err.T, axis=1)
+
+    assert_allclose(fvar_t, fvar)
+    assert_allclose(fvar_err_t, fvar_err)
+
 
 def test_lightcurve_fpp():
 
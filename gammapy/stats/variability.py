@@ -13,6 +13,31 @@ __all__ = [
 ]
 
 
+def _flux_moments(flux, flux_err, axis=0):
+    """Mean flux, number of valid points and mean squared error along an axis."""
+    flux_mean = np.nanmean(flux, axis=axis)
+    n_points = np.count_nonzero(~np.isnan(flux), axis=axis)
+    sig_square = np.nansum(flux_err**2, axis=axis) / n_points
+    return flux_mean, n_points, sig_square
+
+
+def _excess_variance(s_square, sig_square, flux_mean, n_points):
+    """Fractional variability amplitude and its error.
+
+    Shared by the fractional excess variance and the point-to-point fractional
+    variance, which differ only in the estimate of the variance ``s_square``.
+    The error is propagated as in equation B2 of [Vaughan2003].
+    """
+    inv_mean = 1 / flux_mean
+    value = np.sqrt(np.abs(s_square - sig_square)) * inv_mean
+
+    err_a = np.sqrt(1 / (2 * n_points)) * sig_square * inv_mean**2 / value
+    err_b = np.sqrt(sig_square / n_points) * inv_mean
+    value_err = np.sqrt(err_a**2 + err_b**2)
+
+    return value, value_err
+
+
 def compute_fvar(flux, flux_err, axis=0):
     r"""Calculate the fractional excess variance.
 
@@ -52,19 +77,12 @@ def compute_fvar(flux, flux_err, axis=0):
        https://ui.adsabs.harvard.edu/abs/2003MNRAS.345.1271V
     """
 
-    flux_mean = np.nanmean(flux, axis=axis)
-    n_points = np.count_nonzero(~np.isnan(flux), axis=axis)
-
-    s_square = np.nansum((flux - flux_mean) ** 2, axis=axis) / (n_points - 1)
-    sig_square = np.nansum(flux_err**2, axis=axis) / n_points
-    fvar = np.sqrt(np.abs(s_square - sig_square)) / flux_mean
+    flux_mean, n_points, sig_square = _flux_moments(flux, flux_err, axis=axis)
 
-    sigxserr_a = np.sqrt(2 / n_points) * sig_square / flux_mean**2
-    sigxserr_b = np.sqrt(sig_square / n_points) * (2 * fvar / flux_mean)
-    sigxserr = np.sqrt(sigxserr_a**2 + sigxserr_b**2)
-    fvar_err = sigxserr / (2 * fvar)
+    flux_deviation = flux - np.expand_dims(flux_mean, axis=axis)
+    s_square = np.nansum(flux_deviation**2, axis=axis) / (n_points - 1)
 
-    return fvar, fvar_err
+    return _excess_variance(s_square, sig_square, flux_mean, n_points)
 
 
 def compute_fpp(flux, flux_err, axis=0):
@@ -103,22 +121,14 @@ def compute_fpp(flux, flux_err, axis=0):
        https://iopscience.iop.org/article/10.1086/323779
     """
 
-    flux_mean = np.nanmean(flux, axis=axis)
-    n_points = np.count_nonzero(~np.isnan(flux), axis=axis)
+    flux_mean, n_points, sig_square = _flux_moments(flux, flux_err, axis=axis)
     flux = flux.swapaxes(0, axis).T
 
     s_square = np.nansum((flux[..., 1:] - flux[..., :-1]) ** 2, axis=-1) / (
         n_points.T - 1
     )
-    sig_square = np.nansum(flux_err**2, axis=axis) / n_points
-    fpp = np.sqrt(np.abs(s_square.T - sig_square)) / flux_mean
-
-    sigxserr_a = np.sqrt(2 / n_points) * sig_square / flux_mean**2
-    sigxserr_b = np.sqrt(sig_square / n_points) * (2 * fpp / flux_mean)
-    sigxserr = np.sqrt(sigxserr_a**2 + sigxserr_b**2)
-    fpp_err = sigxserr / (2 * fpp)
 
-    return fpp, fpp_err
+    return _excess_variance(s_square.T, sig_square, flux_mean, n_points)
 
 
 def compute_chisq(flux):